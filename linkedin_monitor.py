@@ -15,17 +15,211 @@ import json
 import hashlib
 import smtplib
 import sys
+import argparse
+import logging
 import os
+import re
 import random
+import threading
+import signal
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import io
+import contextlib
+import codecs
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, NamedTuple
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Sequence, TextIO
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from itertools import groupby, chain
+from operator import attrgetter
+from collections import defaultdict
+from email.message import EmailMessage
+from email.utils import parsedate_to_datetime
 from urllib.parse import urlencode, parse_qs, urlparse
 import base64
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson  # Décodage/encodage JSON rapide (optionnel)
+    json_loads = orjson.loads
+    
+    def json_dumps(obj: Any) -> str:
+        """JSON compact UTF-8 (orjson)"""
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+    
+    def json_dumps(obj: Any) -> str:
+        """JSON compact UTF-8 (même sortie que orjson)"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_json_line(stream: TextIO, payload: Dict[str, Any]):
+    """Écriture d'une ligne JSON complète (--json-report)"""
+    stream.write(json_dumps(payload) + "\n")
+    stream.flush()
+
+
+try:
+    import polars as pl  # Lecture rapide des gros CSV (optionnel)
+except ImportError:
+    pl = None
+
+try:
+    import chardet  # Détection d'encodage des CSV non UTF-8 (optionnel)
+except ImportError:
+    chardet = None
+
+# Erreurs fatales journalisées avec leur trace (configuré dans main)
+logger = logging.getLogger('linkedin_monitor')
+
+
+# Catégories média renvoyées par l'API (champ shareMediaCategory)
+MEDIA_CATEGORY_POST_TYPES = {
+    'NONE': 'publication', 'ARTICLE': 'article', 'IMAGE': 'media',
+    'VIDEO': 'media', 'LIVE_VIDEO': 'media', 'RICH': 'media',
+    'CAROUSEL': 'media', 'NATIVE_DOCUMENT': 'media'
+}
+# Type de média par catégorie (à garder aligné sur MEDIA_CATEGORY_POST_TYPES).
+# 'RICH' absent volontairement: image ou vidéo selon le contenu, déterminé par
+# l'inspection du champ media dans _detect_ugc_types
+MEDIA_CATEGORY_MEDIA_TYPES = {
+    'NONE': 'text', 'ARTICLE': 'text', 'IMAGE': 'image', 'CAROUSEL': 'image',
+    'VIDEO': 'video', 'LIVE_VIDEO': 'video', 'NATIVE_DOCUMENT': 'document'
+}
+
+# Expressions compilées une seule fois à l'import
+# Type (company|in) et ID du profil en une seule passe
+_PROFILE_URL_RE = re.compile(r'/(company|in)/([^/?#]*)')
+_PROFILE_URL_TYPES = {'company': 'company', 'in': 'person'}
+
+# Mots-clés de détection du type de post (ordre = priorité)
+POST_TYPE_KEYWORDS = (
+    ('emploi', ('job', 'career', 'hiring', 'position', 'recrut')),
+    ('evenement', ('event', 'webinar', 'conference', 'séminaire')),
+    ('produit', ('product', 'launch', 'nouveau', 'innovation')),
+    ('article', ('article', 'blog', 'read', 'insights')),
+    ('actualite', ('news', 'announce', 'update', 'actualité'))
+)
+# Même table à plat (mot-clé, type): une seule boucle, priorité conservée
+_POST_TYPE_KEYWORD_PAIRS = tuple(
+    (keyword, post_type) for post_type, keywords in POST_TYPE_KEYWORDS for keyword in keywords
+)
+
+# Icônes par type de post et par type de média
+POST_TYPE_ICONS = {
+    'emploi': '💼', 'evenement': '📅', 'produit': '🚀',
+    'article': '📰', 'media': '🎥', 'poll': '📊',
+    'actualite': '🔔', 'publication': '📝'
+}
+MEDIA_TYPE_ICONS = {
+    'video': '🎥', 'image': '🖼️', 'text': '📝',
+    'document': '📄', 'poll': '📊'
+}
+
+# Intervalle (secondes) entre deux requêtes vers un même hôte: adaptatif entre MIN et MAX
+API_BASE_INTERVAL = 5.0
+API_MIN_INTERVAL = 3.0
+API_MAX_INTERVAL = 60.0
+API_INTERVAL_JITTER = 2.0
+
+# Relances sur limitation de débit (HTTP 429/503)
+API_MAX_ATTEMPTS = 5
+API_MAX_BACKOFF = 60.0
+RETRY_STATUSES = (429, 503)
+
+# Taille maximale d'une réponse API lue en mémoire (garde-fou)
+API_MAX_BODY_BYTES = 2 * 1024 * 1024
+
+# Connexions HTTP conservées vers l'API (keep-alive)
+MAX_WORKERS = 8
+
+# Taille à partir de laquelle le CSV est lu avec polars (si installé)
+POLARS_MIN_BYTES = 256 * 1024
+
+# Séparateurs de la sortie console et de l'email texte (construits une fois)
+RULE = "=" * 100
+BANNER = "🚀" + "=" * 98 + "🚀"
+SHORT_RULE = "=" * 50
+SECTION_RULE = "─" * 50 + "\n"
+
+# Format d'affichage des dates (posts et emails)
+DATE_FORMAT = '%d/%m/%Y à %H:%M'
+
+# Colonnes du fichier de profils (ordre d'écriture)
+CSV_FIELDNAMES = ('URL', 'Name', 'Profile_ID', 'Last_Post_ID', 'Error_Count', 'ETag', 'Last_Modified',
+                  'Validator_Endpoint', 'Content_Hash', 'Last_Change')
+
+
+def plural(count: int, suffix: str = 's') -> str:
+    """Marque du pluriel (suffixe si plus d'un élément)"""
+    return suffix if count > 1 else ''
+
+
+@lru_cache(maxsize=4096)
+def parse_profile_url(url: str) -> Tuple[str, str]:
+    """(type, ID) d'une URL de profil; test de sous-chaîne avant toute regex"""
+    if '/company/' not in url and '/in/' not in url:
+        return 'unknown', ''
+    
+    match = _PROFILE_URL_RE.search(url)
+    if not match:
+        return 'unknown', ''
+    return _PROFILE_URL_TYPES[match.group(1)], match.group(2)
+
+
+def read_text_file(path: str) -> str:
+    """Lecture unique du fichier puis décodage (BOM, UTF-8, chardet, sinon cp1252)"""
+    with open(path, 'rb') as file:
+        raw = file.read()
+    
+    if raw.startswith(codecs.BOM_UTF8):
+        return raw.decode('utf-8-sig')
+    if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return raw.decode('utf-16')
+    
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    
+    encoding = chardet.detect(raw[:4096])['encoding'] if chardet is not None else None
+    try:
+        return raw.decode(encoding or 'cp1252')
+    except (UnicodeDecodeError, LookupError):
+        return raw.decode('cp1252', errors='replace')
+
+
+def read_csv_rows(path: str) -> Tuple[List[str], Iterable[Sequence[str]]]:
+    """En-tête et lignes du CSV (parseur polars pour les gros fichiers UTF-8, sinon module csv)"""
+    if pl is not None and os.path.getsize(path) > POLARS_MIN_BYTES:
+        try:
+            frame = pl.read_csv(path, encoding='utf8', infer_schema_length=0).fill_null('')
+            return frame.columns, frame.iter_rows()
+        except Exception:
+            pass  # Encodage non UTF-8 ou CSV irrégulier: lecteur standard
+    
+    reader = csv.reader(io.StringIO(read_text_file(path), newline=''))
+    return next(reader, []), reader
+
+
+def content_fingerprint(elements: List[Dict]) -> str:
+    """Empreinte canonique des posts (IDs + dates de modification, BLAKE2 stable d'un environnement à l'autre)"""
+    hasher = hashlib.blake2b(digest_size=10)
+    
+    # Les compteurs d'engagement changent sans nouveau post: ils restent hors empreinte
+    for element in elements:
+        hasher.update(str(element.get('id', '')).encode('utf-8', 'ignore'))
+        modified = int((element.get('lastModified') or {}).get('time') or 0)  # "time": null toléré
+        hasher.update(modified.to_bytes(8, 'little', signed=True))
+    
+    return hasher.hexdigest()  # 80 bits: largement suffisant pour détecter un changement
 
-class LinkedInPost(NamedTuple):
+
+@dataclass(slots=True, frozen=True)
+class LinkedInPost:
     """Structure pour un post LinkedIn authentique"""
     profile_name: str
     post_title: str
@@ -44,47 +238,118 @@ class LinkedInPost(NamedTuple):
 class ProfileData:
     """Structure pour un profil LinkedIn"""
     
-    def __init__(self, url: str, name: str, profile_id: str = "", last_post_id: str = "", error_count: int = 0):
+    __slots__ = ('url', 'name', 'profile_id', 'last_post_id', 'error_count', 'etag', 'last_modified',
+                 'validator_endpoint', 'content_hash', 'last_change', 'last_check', 'last_success', 'profile_type',
+                 'urn', '_saved_state')
+    
+    def __init__(self, url: str, name: str, profile_id: str = "", last_post_id: str = "", error_count: int = 0,
+                 etag: str = "", last_modified: str = "", content_hash: str = "", last_change: str = "",
+                 validator_endpoint: str = ""):
         self.url = url.strip()
         self.name = name.strip()
-        self.profile_id = profile_id.strip()  # ID LinkedIn extrait de l'URL
+        self.profile_type, url_id = parse_profile_url(self.url)
+        self.profile_id = profile_id.strip() or url_id  # ID LinkedIn (extrait de l'URL si absent)
         self.last_post_id = last_post_id.strip()
         self.error_count = error_count
-        self.last_check = datetime.now().isoformat()
+        self.etag = etag.strip()  # Validateurs HTTP pour GET conditionnel
+        self.last_modified = last_modified.strip()
+        # Endpoint ayant produit validateurs et empreinte (chemin d'URL): jamais envoyés à un autre
+        self.validator_endpoint = validator_endpoint.strip()
+        self.content_hash = content_hash.strip()  # Empreinte de la dernière réponse traitée
+        self.last_change = last_change.strip()  # Dernier nouveau post détecté (ISO 8601, triable)
+        self.last_check = datetime.now()
         self.last_success = None
-        self.profile_type = self._detect_profile_type()
-    
-    def _detect_profile_type(self) -> str:
-        """Détection du type de profil"""
-        if '/company/' in self.url:
-            return 'company'
-        elif '/in/' in self.url:
-            return 'person'
-        return 'unknown'
-    
-    def extract_id_from_url(self) -> str:
-        """Extraction de l'ID LinkedIn depuis l'URL"""
-        if '/company/' in self.url:
-            import re
-            match = re.search(r'/company/([^/]+)', self.url)
-            return match.group(1) if match else ""
-        elif '/in/' in self.url:
-            import re
-            match = re.search(r'/in/([^/]+)', self.url)
-            return match.group(1) if match else ""
+        self.urn = self._build_urn()  # URN auteur pour l'API UGC, résolu une seule fois
+        self._saved_state: Optional[Tuple[str, ...]] = None  # Dernier état écrit dans le CSV
+    
+    def _build_urn(self) -> str:
+        """URN LinkedIn de l'auteur selon le type de profil"""
+        if self.profile_type == 'company':
+            return f"urn:li:organization:{self.profile_id}"
+        elif self.profile_type == 'person':
+            return f"urn:li:person:{self.profile_id}"
         return ""
     
-    def to_dict(self) -> Dict[str, str]:
-        if not self.profile_id:
-            self.profile_id = self.extract_id_from_url()
-        
-        return {
-            'URL': self.url,
-            'Name': self.name,
-            'Profile_ID': self.profile_id,
-            'Last_Post_ID': self.last_post_id,
-            'Error_Count': str(self.error_count)
-        }
+    def to_row(self) -> Tuple[str, ...]:
+        """Ligne CSV dans l'ordre de CSV_FIELDNAMES"""
+        return (self.url, self.name, self.profile_id, self.last_post_id, str(self.error_count),
+                self.etag, self.last_modified, self.validator_endpoint, self.content_hash, self.last_change)
+    
+    def mark_saved(self):
+        """Mémorise l'état persisté du profil"""
+        self._saved_state = self.to_row()
+    
+    @property
+    def is_dirty(self) -> bool:
+        """Vrai si le profil a changé depuis sa dernière persistance"""
+        return self.to_row() != self._saved_state
+
+
+@dataclass(slots=True)
+class APIStats:
+    """Compteurs d'un cycle de monitoring API"""
+    total_profiles: int = 0
+    api_success: int = 0
+    api_errors: int = 0
+    new_posts_found: int = 0
+    total_engagement: int = 0
+    companies_processed: int = 0
+    profiles_processed: int = 0
+    quota_remaining: int = 1000  # Quota API estimé
+    
+    def as_dict(self) -> Dict[str, int]:
+        """Compteurs sous forme de dictionnaire (rapport JSON)"""
+        return asdict(self)
+
+
+class FetchCancelled(Exception):
+    """Profil abandonné: arrêt demandé (SIGINT/SIGTERM) avant ou pendant ses appels API"""
+
+
+class HostRateLimiter:
+    """Intervalle adaptatif entre deux requêtes vers un même hôte (partagé entre threads)"""
+    
+    def __init__(self, base_interval: float = API_BASE_INTERVAL, stop: Optional[threading.Event] = None):
+        self.base_interval = base_interval
+        self.stop = stop or threading.Event()  # Interrompt les attentes en cours (arrêt demandé)
+        self._interval: Dict[str, float] = {}  # Intervalle courant par hôte
+        self._next_ok: Dict[str, float] = {}  # Prochain envoi autorisé par hôte (monotonic)
+        self._lock = threading.Lock()
+    
+    def interval(self, host: str) -> float:
+        """Intervalle courant de l'hôte (secondes)"""
+        return self._interval.get(host, self.base_interval)
+    
+    def reserve(self, host: str) -> float:
+        """Réserve le prochain créneau de l'hôte et renvoie l'attente nécessaire (secondes)"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_ok.get(host, 0.0))
+            self._next_ok[host] = slot + self.interval(host) + random.uniform(0, API_INTERVAL_JITTER)
+        return slot - now
+    
+    def record(self, url: str, throttled: bool):
+        """Ajuste l'intervalle: doublé sur limitation de débit, réduit de 20% sinon"""
+        host = urlparse(url).netloc
+        with self._lock:
+            current = self.interval(host)
+            if throttled:
+                self._interval[host] = min(API_MAX_INTERVAL, current * 2)
+            else:
+                self._interval[host] = max(API_MIN_INTERVAL, current * 0.8)
+            updated = self._interval[host]
+        if throttled and updated != current:
+            print(f"🐢 Limitation {host}: intervalle porté à {updated:.1f}s")
+    
+    def wait(self, url: str):
+        """Attente hors verrou: les autres hôtes ne sont jamais bloqués"""
+        host = urlparse(url).netloc
+        delay = self.reserve(host)
+        if delay > 0:
+            print(f"⏳ Limite de débit {host}: {delay:.1f}s...")
+            self.stop.wait(delay)
+        if self.stop.is_set():
+            raise FetchCancelled(url)
 
 
 class LinkedInAPIClient:
@@ -95,7 +360,11 @@ class LinkedInAPIClient:
         self.client_secret = client_secret
         self.access_token = access_token
         self.base_url = "https://api.linkedin.com/v2"
-        self.session = requests.Session()
+        self.session = self._build_session()
+        self.stop_event = threading.Event()  # Positionné par le moniteur sur SIGINT/SIGTERM
+        self.rate_limiter = HostRateLimiter(stop=self.stop_event)
+        self.rate_limit_remaining: Optional[int] = None  # Dernier X-RateLimit-Remaining reçu
+        self.detection_time = ""  # Horodatage du cycle en cours (fixé par le moniteur)
         
         # Headers API standard
         self.session.headers.update({
@@ -105,6 +374,22 @@ class LinkedInAPIClient:
             'LinkedIn-Version': '202401'  # Version API la plus récente
         })
     
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Session HTTP avec pool de connexions dimensionné et relances sur erreurs serveur"""
+        session = requests.Session()
+        # 429/503 sont relancés par _api_get (Retry-After + backoff exponentiel)
+        retries = Retry(total=2, backoff_factor=0.5, status_forcelist=(500, 502, 504),
+                        allowed_methods=('GET',), raise_on_status=False)
+        # Deux hôtes: api.linkedin.com (données) et www.linkedin.com (OAuth)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=MAX_WORKERS, max_retries=retries)
+        session.mount('https://', adapter)
+        return session
+    
+    def close(self):
+        """Fermeture des connexions HTTP du pool"""
+        self.session.close()
+    
     def authenticate_client_credentials(self) -> bool:
         """Authentification Client Credentials pour accès lecture"""
         try:
@@ -119,10 +404,11 @@ class LinkedInAPIClient:
                 'scope': 'r_organization_social r_basicprofile'  # Permissions lecture
             }
             
-            auth_response = requests.post(
+            # Via la session: connexion TLS conservée (en-tête Authorization de l'API retiré)
+            auth_response = self.session.post(
                 auth_url,
                 data=auth_data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                headers={'Content-Type': 'application/x-www-form-urlencoded', 'Authorization': None},
                 timeout=30
             )
             
@@ -144,8 +430,92 @@ class LinkedInAPIClient:
             print(f"❌ Erreur authentification: {e}")
             return False
     
-    def get_company_posts(self, company_id: str, count: int = 10) -> List[LinkedInPost]:
-        """Récupération des posts d'une entreprise"""
+    def _api_get(self, endpoint: str, params: Dict[str, Any], profile: Optional[ProfileData] = None) -> requests.Response:
+        """Requête GET avec en-têtes conditionnels si le profil a des validateurs de cet endpoint"""
+        headers = {}
+        if self._validators_from(endpoint, profile):
+            if profile.etag:
+                headers['If-None-Match'] = profile.etag
+            if profile.last_modified:
+                headers['If-Modified-Since'] = profile.last_modified
+        
+        for attempt in range(API_MAX_ATTEMPTS):
+            self.rate_limiter.wait(endpoint)
+            response = self.session.get(endpoint, params=params, headers=headers, timeout=30, stream=True)
+            
+            remaining = response.headers.get('X-RateLimit-Remaining', '')
+            if remaining.isdigit():
+                self.rate_limit_remaining = int(remaining)
+            self.rate_limiter.record(endpoint, response.status_code in RETRY_STATUSES)
+            
+            if response.status_code not in RETRY_STATUSES or attempt == API_MAX_ATTEMPTS - 1:
+                break
+            
+            delay = self._retry_delay(response, attempt)
+            response.close()
+            print(f"⏳ HTTP {response.status_code} - nouvelle tentative dans {delay:.1f}s...")
+            self.stop_event.wait(delay)  # La tentative suivante lève FetchCancelled si arrêt demandé
+        
+        if response.status_code != 200:
+            response.content  # Corps d'erreur court: lu tout de suite pour libérer la connexion
+        return response
+    
+    @staticmethod
+    def _decode_json(response: requests.Response) -> Dict:
+        """JSON décodé directement depuis les octets, lecture en flux bornée à API_MAX_BODY_BYTES"""
+        chunks = []
+        total = 0
+        
+        for chunk in response.iter_content(chunk_size=65536):
+            total += len(chunk)
+            if total > API_MAX_BODY_BYTES:
+                response.close()
+                raise ValueError(f"Réponse API trop volumineuse (> {API_MAX_BODY_BYTES // 1024} Ko)")
+            chunks.append(chunk)
+        
+        return json_loads(b''.join(chunks))
+    
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> float:
+        """Délai avant relance: Retry-After si fourni, sinon backoff exponentiel avec jitter"""
+        retry_after = response.headers.get('Retry-After', '').strip()
+        delay = None
+        
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now().astimezone()).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+        
+        if delay is None:
+            delay = 2 ** attempt + random.uniform(0, 1)
+        
+        return min(max(delay, 0.0), API_MAX_BACKOFF)
+    
+    @staticmethod
+    def _validators_from(endpoint: str, profile: Optional[ProfileData]) -> bool:
+        """Vrai si les validateurs du profil ont été produits par cet endpoint (principal ou UGC)"""
+        return profile is not None and profile.validator_endpoint == urlparse(endpoint).path
+    
+    def _store_validators(self, response: requests.Response, profile: Optional[ProfileData], fingerprint: str,
+                          endpoint: str):
+        """Mémorisation ETag / Last-Modified / empreinte (et endpoint d'origine) pour le prochain cycle"""
+        if profile is not None:
+            profile.etag = response.headers.get('ETag', '')
+            profile.last_modified = response.headers.get('Last-Modified', '')
+            profile.validator_endpoint = urlparse(endpoint).path
+            profile.content_hash = fingerprint
+    
+    def _same_content(self, fingerprint: str, profile: Optional[ProfileData], endpoint: str) -> bool:
+        """Vrai si la réponse est identique à celle du dernier cycle sur le même endpoint (serveur sans 304)"""
+        return self._validators_from(endpoint, profile) and fingerprint == profile.content_hash
+    
+    def get_company_posts(self, company_id: str, count: int = 10,
+                          profile: Optional[ProfileData] = None) -> Optional[List[LinkedInPost]]:
+        """Récupération des posts d'une entreprise (None si inchangé - HTTP 304)"""
         try:
             print(f"🏢 Récupération posts entreprise: {company_id}")
             
@@ -159,11 +529,21 @@ class LinkedInAPIClient:
                 'sortBy': 'CREATED'  # Plus récents en premier
             }
             
-            response = self.session.get(endpoint, params=params, timeout=30)
+            response = self._api_get(endpoint, params, profile)
             
-            if response.status_code == 200:
-                data = response.json()
-                return self._parse_posts_response(data, company_id, 'company')
+            if response.status_code == 304:
+                print("♻️ Posts entreprise inchangés (HTTP 304)")
+                return None
+            elif response.status_code == 200:
+                data = self._decode_json(response)
+                fingerprint = content_fingerprint(data.get('elements', []))
+                if self._same_content(fingerprint, profile, endpoint):
+                    print("♻️ Posts entreprise inchangés (empreinte identique)")
+                    return None
+                posts = self._parse_posts_response(data, company_id, 'company', self._known_post_id(profile))
+                if posts:
+                    self._store_validators(response, profile, fingerprint, endpoint)
+                return posts
             elif response.status_code == 401:
                 print("❌ Token expiré - réauthentification nécessaire")
                 return []
@@ -171,12 +551,15 @@ class LinkedInAPIClient:
                 print(f"❌ Erreur API: {response.status_code} - {response.text}")
                 return []
                 
+        except FetchCancelled:
+            raise
         except Exception as e:
             print(f"❌ Erreur récupération posts entreprise: {e}")
             return []
     
-    def get_profile_posts(self, profile_id: str, count: int = 10) -> List[LinkedInPost]:
-        """Récupération des posts d'un profil personnel"""
+    def get_profile_posts(self, profile_id: str, count: int = 10,
+                          profile: Optional[ProfileData] = None) -> Optional[List[LinkedInPost]]:
+        """Récupération des posts d'un profil personnel (None si inchangé - HTTP 304)"""
         try:
             print(f"👤 Récupération posts profil: {profile_id}")
             
@@ -188,11 +571,21 @@ class LinkedInAPIClient:
                 'sortBy': 'CREATED'
             }
             
-            response = self.session.get(endpoint, params=params, timeout=30)
+            response = self._api_get(endpoint, params, profile)
             
-            if response.status_code == 200:
-                data = response.json()
-                return self._parse_posts_response(data, profile_id, 'person')
+            if response.status_code == 304:
+                print("♻️ Posts profil inchangés (HTTP 304)")
+                return None
+            elif response.status_code == 200:
+                data = self._decode_json(response)
+                fingerprint = content_fingerprint(data.get('elements', []))
+                if self._same_content(fingerprint, profile, endpoint):
+                    print("♻️ Posts profil inchangés (empreinte identique)")
+                    return None
+                posts = self._parse_posts_response(data, profile_id, 'person', self._known_post_id(profile))
+                if posts:
+                    self._store_validators(response, profile, fingerprint, endpoint)
+                return posts
             elif response.status_code == 403:
                 print("⚠️ Permissions insuffisantes pour profils personnels")
                 return []
@@ -200,12 +593,15 @@ class LinkedInAPIClient:
                 print(f"❌ Erreur API: {response.status_code}")
                 return []
                 
+        except FetchCancelled:
+            raise
         except Exception as e:
             print(f"❌ Erreur récupération posts profil: {e}")
             return []
     
-    def get_ugc_posts(self, author_urn: str, count: int = 10) -> List[LinkedInPost]:
-        """Récupération via UGC Posts API (plus récent)"""
+    def get_ugc_posts(self, author_urn: str, count: int = 10,
+                      profile: Optional[ProfileData] = None) -> Optional[List[LinkedInPost]]:
+        """Récupération via UGC Posts API (None si inchangé - HTTP 304)"""
         try:
             print(f"📝 Récupération UGC posts: {author_urn}")
             
@@ -218,30 +614,53 @@ class LinkedInAPIClient:
                 'lifecycleState': 'PUBLISHED'
             }
             
-            response = self.session.get(endpoint, params=params, timeout=30)
+            response = self._api_get(endpoint, params, profile)
             
-            if response.status_code == 200:
-                data = response.json()
-                return self._parse_ugc_posts_response(data, author_urn)
+            if response.status_code == 304:
+                print("♻️ UGC posts inchangés (HTTP 304)")
+                return None
+            elif response.status_code == 200:
+                data = self._decode_json(response)
+                fingerprint = content_fingerprint(data.get('elements', []))
+                if self._same_content(fingerprint, profile, endpoint):
+                    print("♻️ UGC posts inchangés (empreinte identique)")
+                    return None
+                posts = self._parse_ugc_posts_response(data, author_urn, self._known_post_id(profile))
+                if posts:
+                    self._store_validators(response, profile, fingerprint, endpoint)
+                return posts
             else:
                 print(f"❌ Erreur UGC API: {response.status_code}")
                 return []
                 
+        except FetchCancelled:
+            raise
         except Exception as e:
             print(f"❌ Erreur UGC posts: {e}")
             return []
     
-    def _parse_posts_response(self, data: Dict, profile_id: str, profile_type: str) -> List[LinkedInPost]:
-        """Parse la réponse API en posts structurés"""
+    @staticmethod
+    def _known_post_id(profile: Optional[ProfileData]) -> str:
+        """Dernier post connu du profil (arrêt de l'extraction)"""
+        return profile.last_post_id if profile is not None else ""
+    
+    def _parse_posts_response(self, data: Dict, profile_id: str, profile_type: str,
+                              stop_at_id: str = "") -> List[LinkedInPost]:
+        """Parse la réponse API en posts structurés (jusqu'au dernier post connu inclus)"""
         posts = []
         
         try:
             elements = data.get('elements', [])
+            # Horodatage du cycle, sinon calculé une seule fois par réponse
+            detection_time = self.detection_time or datetime.now().strftime(DATE_FORMAT)
             
             for element in elements:
-                post = self._extract_post_data(element, profile_id, profile_type)
+                post = self._extract_post_data(element, profile_id, profile_type, detection_time)
                 if post:
                     posts.append(post)
+                    # Les posts plus anciens sont déjà connus: inutile de les extraire
+                    if stop_at_id and post.post_id == stop_at_id:
+                        break
             
             print(f"✅ {len(posts)} posts extraits de l'API")
             return posts
@@ -250,17 +669,21 @@ class LinkedInAPIClient:
             print(f"❌ Erreur parsing posts: {e}")
             return []
     
-    def _parse_ugc_posts_response(self, data: Dict, author_urn: str) -> List[LinkedInPost]:
-        """Parse la réponse UGC Posts API"""
+    def _parse_ugc_posts_response(self, data: Dict, author_urn: str, stop_at_id: str = "") -> List[LinkedInPost]:
+        """Parse la réponse UGC Posts API (jusqu'au dernier post connu inclus)"""
         posts = []
         
         try:
             elements = data.get('elements', [])
+            # Horodatage du cycle, sinon calculé une seule fois par réponse
+            detection_time = self.detection_time or datetime.now().strftime(DATE_FORMAT)
             
             for element in elements:
-                post = self._extract_ugc_post_data(element, author_urn)
+                post = self._extract_ugc_post_data(element, author_urn, detection_time)
                 if post:
                     posts.append(post)
+                    if stop_at_id and post.post_id == stop_at_id:
+                        break
             
             print(f"✅ {len(posts)} UGC posts extraits")
             return posts
@@ -269,7 +692,8 @@ class LinkedInAPIClient:
             print(f"❌ Erreur parsing UGC posts: {e}")
             return []
     
-    def _extract_post_data(self, element: Dict, profile_id: str, profile_type: str) -> Optional[LinkedInPost]:
+    def _extract_post_data(self, element: Dict, profile_id: str, profile_type: str,
+                           detection_time: str = "") -> Optional[LinkedInPost]:
         """Extraction des données d'un post"""
         try:
             # ID du post
@@ -288,7 +712,7 @@ class LinkedInAPIClient:
             
             # Date de publication
             created_time = element.get('created', {}).get('time', 0)
-            published_date = datetime.fromtimestamp(created_time / 1000).strftime('%d/%m/%Y à %H:%M') if created_time else ""
+            published_date = datetime.fromtimestamp(created_time / 1000).strftime(DATE_FORMAT) if created_time else ""
             
             # URL du post
             post_url = self._generate_post_url(element.get('id', ''), profile_type)
@@ -305,7 +729,7 @@ class LinkedInAPIClient:
                 post_title=title,
                 post_description=description,
                 post_url=post_url,
-                detection_time=datetime.now().strftime('%d/%m/%Y à %H:%M'),
+                detection_time=detection_time or datetime.now().strftime(DATE_FORMAT),
                 post_id=post_id[:12],  # Tronqué pour l'affichage
                 post_type=post_type,
                 author_name=author_name,
@@ -319,7 +743,8 @@ class LinkedInAPIClient:
             print(f"❌ Erreur extraction post: {e}")
             return None
     
-    def _extract_ugc_post_data(self, element: Dict, author_urn: str) -> Optional[LinkedInPost]:
+    def _extract_ugc_post_data(self, element: Dict, author_urn: str,
+                               detection_time: str = "") -> Optional[LinkedInPost]:
         """Extraction des données UGC Post"""
         try:
             # ID du post
@@ -338,21 +763,20 @@ class LinkedInAPIClient:
             
             # Métadonnées
             created_time = element.get('created', {}).get('time', 0)
-            published_date = datetime.fromtimestamp(created_time / 1000).strftime('%d/%m/%Y à %H:%M') if created_time else ""
+            published_date = datetime.fromtimestamp(created_time / 1000).strftime(DATE_FORMAT) if created_time else ""
             
             # URL du post
             post_url = f"https://www.linkedin.com/feed/update/urn:li:ugcPost:{post_id}/"
             
             # Type et média
-            post_type = self._detect_ugc_post_type(specific_content)
-            media_type = self._detect_ugc_media_type(specific_content)
+            post_type, media_type = self._detect_ugc_types(specific_content)
             
             return LinkedInPost(
                 profile_name=author_urn.split(':')[-1],
                 post_title=title,
                 post_description=description,
                 post_url=post_url,
-                detection_time=datetime.now().strftime('%d/%m/%Y à %H:%M'),
+                detection_time=detection_time or datetime.now().strftime(DATE_FORMAT),
                 post_id=post_id[:12],
                 post_type=post_type,
                 author_name=author_urn.split(':')[-1],
@@ -406,18 +830,17 @@ class LinkedInAPIClient:
         if not text:
             return "Publication LinkedIn"
         
-        # Première phrase comme titre
-        sentences = [s.strip() for s in text.split('.') if len(s.strip()) > 15]
-        if sentences:
-            title = sentences[0]
+        # Première phrase comme titre (arrêt à la première phrase assez longue)
+        title = next((s for s in map(str.strip, text.split('.')) if len(s) > 15), None)
+        if title:
             if len(title) <= 80:
                 return title + ("." if not title.endswith(('.', '!', '?')) else "")
             else:
-                words = title.split()[:12]
+                words = title.split(maxsplit=12)[:12]
                 return " ".join(words) + "..."
         
         # Fallback: premiers mots
-        words = text.split()[:15]
+        words = text.split(maxsplit=15)[:15]
         return " ".join(words) + ("..." if len(words) == 15 else "")
     
     def _create_smart_description_from_text(self, text: str) -> str:
@@ -429,17 +852,24 @@ class LinkedInAPIClient:
         if len(text) <= 200:
             return text.strip()
         
-        # Troncature intelligente
-        sentences = text.split('.')
-        description = ""
-        
-        for sentence in sentences:
-            if len(description + sentence) <= 190:
-                description += sentence + "."
-            else:
+        # Troncature intelligente (phrases entières, longueur suivie sans reconcaténer)
+        kept = []
+        length = 0
+        for sentence in text.split('.'):
+            if length + len(sentence) > 190:
                 break
+            kept.append(sentence)
+            length += len(sentence) + 1
         
-        return description.strip() or text[:190] + "..."
+        description = "".join(sentence + "." for sentence in kept).strip()
+        if description:
+            return description
+        
+        # Première phrase trop longue: coupure sur une frontière de mot si elle garde
+        # l'essentiel du texte (sinon coupure brute: texte sans espaces, CJK, hashtags)
+        head = text[:190]
+        cut = head.rsplit(' ', 1)[0].rstrip()
+        return (cut if len(cut) >= 95 else head) + "..."
     
     def _extract_author_name(self, author: Dict) -> str:
         """Extraction du nom de l'auteur"""
@@ -481,49 +911,54 @@ class LinkedInAPIClient:
         """Détection intelligente du type de post"""
         content_str = json.dumps(content).lower()
         
-        type_patterns = {
-            'emploi': ['job', 'career', 'hiring', 'position', 'recrut'],
-            'evenement': ['event', 'webinar', 'conference', 'séminaire'],
-            'produit': ['product', 'launch', 'nouveau', 'innovation'],
-            'article': ['article', 'blog', 'read', 'insights'],
-            'actualite': ['news', 'announce', 'update', 'actualité']
-        }
-        
-        for post_type, keywords in type_patterns.items():
-            if any(keyword in content_str for keyword in keywords):
+        for keyword, post_type in _POST_TYPE_KEYWORD_PAIRS:
+            if keyword in content_str:
                 return post_type
         
         return 'publication'
     
-    def _detect_ugc_post_type(self, specific_content: Dict) -> str:
-        """Détection type pour UGC posts"""
+    def _detect_ugc_types(self, specific_content: Dict) -> Tuple[str, str]:
+        """Détection (type de post, type de média) UGC en une seule passe"""
+        # Lecture directe du champ structuré: aucune sérialisation
+        category = specific_content.get('shareMediaCategory', '')
+        if category in MEDIA_CATEGORY_POST_TYPES and category in MEDIA_CATEGORY_MEDIA_TYPES:
+            return MEDIA_CATEGORY_POST_TYPES[category], MEDIA_CATEGORY_MEDIA_TYPES[category]
+        
+        # Fallback: recherche dans le contenu sérialisé
         content_str = json.dumps(specific_content).lower()
         
-        if 'media' in content_str:
-            return 'media'
+        if category in MEDIA_CATEGORY_POST_TYPES:
+            post_type = MEDIA_CATEGORY_POST_TYPES[category]
+        elif 'media' in content_str:
+            post_type = 'media'
         elif 'article' in content_str:
-            return 'article'
+            post_type = 'article'
         elif 'poll' in content_str:
-            return 'poll'
+            post_type = 'poll'
+        else:
+            post_type = 'publication'
         
-        return 'publication'
+        media_type = 'text'
+        media = specific_content.get('media', [])
+        if media:
+            media_str = json.dumps(media).lower()
+            if 'video' in media_str:
+                media_type = 'video'
+            elif 'image' in media_str:
+                media_type = 'image'
+        
+        return post_type, media_type
     
     def _detect_media_type(self, content: Dict) -> str:
         """Détection du type de média"""
-        if content.get('media'):
-            media = content['media']
-            if any('video' in str(m).lower() for m in media):
-                return 'video'
-            elif any('image' in str(m).lower() for m in media):
-                return 'image'
-        
-        return 'text'
-    
-    def _detect_ugc_media_type(self, specific_content: Dict) -> str:
-        """Détection type média UGC"""
-        media = specific_content.get('media', [])
+        category = content.get('shareMediaCategory', '')
+        if category in MEDIA_CATEGORY_MEDIA_TYPES:
+            return MEDIA_CATEGORY_MEDIA_TYPES[category]
+
+        media = content.get('media')
         if media:
-            media_str = json.dumps(media).lower()
+            # Une seule conversion en texte pour tous les éléments média
+            media_str = str(media).lower()
             if 'video' in media_str:
                 return 'video'
             elif 'image' in media_str:
@@ -532,121 +967,35 @@ class LinkedInAPIClient:
         return 'text'
 
 
-class APIBasedEmailNotifier:
-    """Notificateur email optimisé pour API LinkedIn"""
-    
-    def __init__(self, sender_email: str, sender_password: str, recipient_email: str):
-        self.sender_email = sender_email
-        self.sender_password = sender_password
-        self.recipient_email = recipient_email
-    
-    def send_api_optimized_notification(self, all_posts: List[LinkedInPost]) -> bool:
-        """Notification optimisée pour posts API"""
-        try:
-            if not all_posts:
-                print("ℹ️ Aucun post API à notifier")
-                return True
-            
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.sender_email
-            msg['To'] = self.recipient_email
-            msg['Subject'] = self._create_api_subject(all_posts)
-            
-            # Contenu texte optimisé
-            text_content = self._build_api_text_message(all_posts)
-            text_part = MIMEText(text_content, 'plain', 'utf-8')
-            
-            # HTML révolutionnaire pour API
-            html_content = self._build_api_html_message(all_posts)
-            html_part = MIMEText(html_content, 'html', 'utf-8')
-            
-            msg.attach(text_part)
-            msg.attach(html_part)
-            
-            # Envoi
-            with smtplib.SMTP("smtp.gmail.com", 587) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
-            
-            print(f"📧 Email API optimisé envoyé: {len(all_posts)} posts")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Erreur envoi email API: {e}")
-            return False
-    
-    def _create_api_subject(self, posts: List[LinkedInPost]) -> str:
-        """Sujet optimisé pour posts API"""
-        count = len(posts)
-        profiles = len(set(post.profile_name for post in posts))
-        
-        # Analyse des types
-        post_types = [post.post_type for post in posts]
-        media_types = [post.media_type for post in posts]
-        
-        if 'video' in media_types:
-            return f"🎥 {count} vidéo{'s' if count > 1 else ''} LinkedIn détectée{'s' if count > 1 else ''} via API !"
-        elif 'emploi' in post_types:
-            return f"💼 {count} opportunité{'s' if count > 1 else ''} emploi LinkedIn !"
-        elif 'evenement' in post_types:
-            return f"📅 {count} événement{'s' if count > 1 else ''} professionnel{'s' if count > 1 else ''} !"
-        elif 'article' in post_types:
-            return f"📰 {count} article{'s' if count > 1 else ''} LinkedIn publié{'s' if count > 1 else ''} !"
-        else:
-            return f"🚀 {count} publication{'s' if count > 1 else ''} LinkedIn de {profiles} profil{'s' if profiles > 1 else ''} !"
-    
-    def _build_api_text_message(self, posts: List[LinkedInPost]) -> str:
-        """Message texte optimisé API"""
-        total_engagement = sum(post.engagement_count for post in posts)
-        
-        content = f"""🚀 LINKEDIN API MONITOR - POSTS AUTHENTIQUES
+# Gabarits de l'email texte
+_TEXT_HEAD_TEMPLATE = """🚀 LINKEDIN API MONITOR - POSTS AUTHENTIQUES
 
-📅 {datetime.now().strftime('%d/%m/%Y à %H:%M UTC')}
-📊 {len(posts)} publication{'s' if len(posts) > 1 else ''} via API officielle
+📅 {sent_at}
+📊 {post_count} publication{plural_s} via API officielle
 💬 {total_engagement} interactions totales
 🔥 Contenu 100% authentique LinkedIn
 
 """
-        
-        # Groupement par profil
-        profiles_posts = {}
-        for post in posts:
-            if post.profile_name not in profiles_posts:
-                profiles_posts[post.profile_name] = []
-            profiles_posts[post.profile_name].append(post)
-        
-        for profile_name, profile_posts in profiles_posts.items():
-            content += f"👤 {profile_name.upper()}\n"
-            content += "─" * 50 + "\n"
-            
-            for post in profile_posts:
-                type_icon = self._get_type_icon(post.post_type)
-                media_icon = self._get_media_icon(post.media_type)
-                
-                content += f"""{type_icon} TITRE: {post.post_title}
+
+_TEXT_PROFILE_TEMPLATE = "👤 {profile_name}\n" + SECTION_RULE
+
+_TEXT_POST_TEMPLATE = """{type_icon} TITRE: {post.post_title}
 ✏️ DESCRIPTION: {post.post_description}
 👤 AUTEUR: {post.author_name}
 📅 PUBLIÉ: {post.published_date}
-{media_icon} TYPE: {post.media_type.upper()}
+{media_icon} TYPE: {media_label}
 💬 ENGAGEMENT: {post.engagement_count} interactions
 🔗 LIEN: {post.post_url}
 
 """
-        
-        content += """🤖 LinkedIn API Monitor v4.0
+
+_TEXT_FOOTER = """🤖 LinkedIn API Monitor v4.0
 Extraction authentique via API officielle LinkedIn
 Système de veille professionnel automatisé
 """
-        
-        return content
-    
-    def _build_api_html_message(self, posts: List[LinkedInPost]) -> str:
-        """Email HTML révolutionnaire pour API"""
-        total_engagement = sum(post.engagement_count for post in posts)
-        profiles_count = len(set(post.profile_name for post in posts))
-        
-        html = f"""<!DOCTYPE html>
+
+# Gabarits de l'email HTML (CSS doublé {{ }} pour str.format)
+_HTML_HEAD_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -1276,7 +1625,7 @@ Système de veille professionnel automatisé
         
         <div class="stats-dashboard">
             <div class="stat-card">
-                <span class="stat-value">{len(posts)}</span>
+                <span class="stat-value">{post_count}</span>
                 <span class="stat-label">Posts Authentiques</span>
             </div>
             <div class="stat-card">
@@ -1295,21 +1644,11 @@ Système de veille professionnel automatisé
         
         <div class="content">
 """
-        
-        # Posts avec design ultra-premium
-        profiles_posts = {}
-        for post in posts:
-            if post.profile_name not in profiles_posts:
-                profiles_posts[post.profile_name] = []
-            profiles_posts[post.profile_name].append(post)
-        
-        for profile_name, profile_posts in profiles_posts.items():
-            for post in profile_posts:
-                type_icon = self._get_type_icon(post.post_type)
-                media_icon = self._get_media_icon(post.media_type)
-                avatar_letter = profile_name[0].upper()
-                
-                html += f"""
+
+# Échappement HTML en une passe C (str.translate) des champs venant de l'API
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'})
+
+_HTML_POST_TEMPLATE = """
             <div class="post-card">
                 <div class="post-header">
                     <div class="profile-avatar">{avatar_letter}</div>
@@ -1317,17 +1656,17 @@ Système de veille professionnel automatisé
                         <div class="profile-name">{profile_name}</div>
                         <div class="post-metadata">
                             <span class="api-badge">🚀 API OFFICIELLE</span>
-                            <span class="post-type-badge">{type_icon} {post.post_type.replace('_', ' ').title()}</span>
-                            <span class="media-badge">{media_icon} {post.media_type.upper()}</span>
+                            <span class="post-type-badge">{type_icon} {type_label}</span>
+                            <span class="media-badge">{media_icon} {media_label}</span>
                             <span class="engagement-counter">💬 {post.engagement_count}</span>
                         </div>
                     </div>
                 </div>
                 
                 <div class="post-main-content">
-                    <div class="post-title">{post.post_title}</div>
+                    <div class="post-title">{title}</div>
                     <div class="post-description">
-                        {post.post_description}
+                        {description}
                     </div>
                 </div>
                 
@@ -1335,7 +1674,7 @@ Système de veille professionnel automatisé
                     <div class="post-meta-info">
                         <div class="meta-row">
                             <span>👤</span>
-                            <span><strong>Auteur:</strong> {post.author_name}</span>
+                            <span><strong>Auteur:</strong> {author}</span>
                         </div>
                         <div class="meta-row">
                             <span>📅</span>
@@ -1346,15 +1685,15 @@ Système de veille professionnel automatisé
                             <span><strong>ID:</strong> {post.post_id}</span>
                         </div>
                     </div>
-                    <a href="{post.post_url}" class="view-post-btn" target="_blank">
+                    <a href="{url}" class="view-post-btn" target="_blank">
                         <span>🎯</span>
                         <span>Voir le Post</span>
                     </a>
                 </div>
             </div>
 """
-        
-        html += f"""
+
+_HTML_FOOTER_TEMPLATE = """
         </div>
         
         <div class="api-intelligence-section">
@@ -1364,7 +1703,7 @@ Système de veille professionnel automatisé
             
             <div class="api-stats-grid">
                 <div class="api-stat-card">
-                    <div class="api-stat-number">{len(posts)}</div>
+                    <div class="api-stat-number">{post_count}</div>
                     <div class="api-stat-label">Posts API Extraits</div>
                 </div>
                 <div class="api-stat-card">
@@ -1402,39 +1741,202 @@ Système de veille professionnel automatisé
                 Système de Veille Révolutionnaire • API Officielle LinkedIn • Extraction Authentique
             </div>
             <div style="font-size: 15px; opacity: 0.8; margin-top: 20px; position: relative; z-index: 2;">
-                Dernière synchronisation API: {datetime.now().strftime('%d/%m/%Y à %H:%M UTC')} • Version 4.0 Officielle
+                Dernière synchronisation API: {sync_time} • Version 4.0 Officielle
             </div>
         </div>
     </div>
 </body>
 </html>
 """
+
+
+class APIBasedEmailNotifier:
+    """Notificateur email optimisé pour API LinkedIn"""
+    
+    def __init__(self, sender_email: str, sender_password: str, recipient_email: str):
+        self.sender_email = sender_email
+        self.sender_password = sender_password
+        self.recipient_email = recipient_email
+        self._smtp: Optional[smtplib.SMTP] = None  # Connexion conservée pour tout le cycle
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Connexion SMTP authentifiée, ouverte au premier envoi puis réutilisée"""
+        if self._smtp is None:
+            server = smtplib.SMTP("smtp.gmail.com", 587, timeout=30)
+            try:
+                server.starttls()
+                server.login(self.sender_email, self.sender_password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+        return self._smtp
+    
+    def close(self):
+        """Fermeture de la connexion SMTP en fin de cycle"""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
+    
+    def send_api_optimized_notification(self, all_posts: List[LinkedInPost]) -> bool:
+        """Notification optimisée pour posts API"""
+        try:
+            if not all_posts:
+                print("ℹ️ Aucun post API à notifier")
+                return True
+            
+            # En-têtes encodés (RFC 2047) et parties MIME gérés par EmailMessage
+            msg = EmailMessage()
+            msg['From'] = self.sender_email
+            msg['To'] = self.recipient_email
+            # Groupement par profil calculé une seule fois pour sujet, texte et HTML
+            grouped = self._group_posts(all_posts)
+            sent_at = datetime.now().strftime(f'{DATE_FORMAT} UTC')  # Même horodatage texte et HTML
+            msg['Subject'] = self._create_api_subject(all_posts, grouped)
+            
+            # Contenu texte optimisé
+            msg.set_content(self._build_api_text_message(all_posts, grouped, sent_at))
+            
+            # HTML révolutionnaire pour API (alternative au texte)
+            msg.add_alternative(self._build_api_html_message(all_posts, grouped, sent_at), subtype='html')
+            
+            # Envoi (connexion réutilisée; abandonnée en cas d'échec pour être rouverte au prochain envoi)
+            try:
+                self._get_smtp().send_message(msg)
+            except (smtplib.SMTPException, OSError):
+                self.close()
+                raise
+            
+            print(f"📧 Email API optimisé envoyé: {len(all_posts)} posts")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Erreur envoi email API: {e}")
+            return False
+    
+    @staticmethod
+    def _group_posts(posts: List[LinkedInPost]) -> Dict[str, List[LinkedInPost]]:
+        """Posts groupés par profil (ordre de première apparition conservé)"""
+        # Les posts arrivent déjà contigus par profil: un accès dict par série, pas par post
+        grouped = defaultdict(list)
+        for profile_name, run in groupby(posts, key=attrgetter('profile_name')):
+            grouped[profile_name].extend(run)
+        return grouped
+    
+    def _create_api_subject(self, posts: List[LinkedInPost],
+                            grouped: Optional[Dict[str, List[LinkedInPost]]] = None) -> str:
+        """Sujet optimisé pour posts API"""
+        count = len(posts)
+        profiles = len(grouped if grouped is not None else self._group_posts(posts))
+        plural_s = plural(count)  # Accords calculés une seule fois
+        profiles_s = plural(profiles)
+        
+        # Analyse des types (ensembles: seule l'appartenance est testée)
+        post_types = {post.post_type for post in posts}
+        media_types = {post.media_type for post in posts}
         
-        return html
+        if 'video' in media_types:
+            return f"🎥 {count} vidéo{plural_s} LinkedIn détectée{plural_s} via API !"
+        elif 'emploi' in post_types:
+            return f"💼 {count} opportunité{plural_s} emploi LinkedIn !"
+        elif 'evenement' in post_types:
+            return f"📅 {count} événement{plural_s} professionnel{plural_s} !"
+        elif 'article' in post_types:
+            return f"📰 {count} article{plural_s} LinkedIn publié{plural_s} !"
+        else:
+            return f"🚀 {count} publication{plural_s} LinkedIn de {profiles} profil{profiles_s} !"
+    
+    def _build_api_text_message(self, posts: List[LinkedInPost],
+                                grouped: Optional[Dict[str, List[LinkedInPost]]] = None,
+                                sent_at: str = "") -> str:
+        """Message texte optimisé API"""
+        total_engagement = sum(post.engagement_count for post in posts)
+        post_count = len(posts)
+        sent_at = sent_at or datetime.now().strftime(f'{DATE_FORMAT} UTC')
+        
+        # Gabarits constants formatés, assemblés une seule fois par join
+        parts = [_TEXT_HEAD_TEMPLATE.format(sent_at=sent_at, post_count=post_count,
+                                            plural_s=plural(post_count),
+                                            total_engagement=total_engagement)]
+        
+        # Groupement par profil
+        profiles_posts = grouped if grouped is not None else self._group_posts(posts)
+        
+        for profile_name, profile_posts in profiles_posts.items():
+            parts.append(_TEXT_PROFILE_TEMPLATE.format(profile_name=profile_name.upper()))
+            
+            for post in profile_posts:
+                parts.append(_TEXT_POST_TEMPLATE.format(
+                    post=post,
+                    type_icon=self._get_type_icon(post.post_type),
+                    media_icon=self._get_media_icon(post.media_type),
+                    media_label=post.media_type.upper()
+                ))
+        
+        parts.append(_TEXT_FOOTER)
+        
+        return "".join(parts)
+    
+    def _build_api_html_message(self, posts: List[LinkedInPost],
+                                grouped: Optional[Dict[str, List[LinkedInPost]]] = None,
+                                sent_at: str = "") -> str:
+        """Email HTML révolutionnaire pour API"""
+        total_engagement = sum(post.engagement_count for post in posts)
+        profiles_posts = grouped if grouped is not None else self._group_posts(posts)
+        profiles_count = len(profiles_posts)
+        post_count = len(posts)
+        
+        # Gabarits constants formatés (pas de gros f-string réévalué à chaque envoi)
+        parts = [_HTML_HEAD_TEMPLATE.format(post_count=post_count, profiles_count=profiles_count,
+                                            total_engagement=total_engagement)]
+        
+        # Posts avec design ultra-premium
+        for profile_name, profile_posts in profiles_posts.items():
+            safe_name = profile_name.translate(_HTML_ESCAPE_TABLE)
+            avatar_letter = profile_name[0].upper().translate(_HTML_ESCAPE_TABLE)
+            for post in profile_posts:
+                parts.append(_HTML_POST_TEMPLATE.format(
+                    post=post,
+                    profile_name=safe_name,
+                    avatar_letter=avatar_letter,
+                    title=post.post_title.translate(_HTML_ESCAPE_TABLE),
+                    description=post.post_description.translate(_HTML_ESCAPE_TABLE),
+                    author=post.author_name.translate(_HTML_ESCAPE_TABLE),
+                    url=post.post_url.translate(_HTML_ESCAPE_TABLE),
+                    type_icon=self._get_type_icon(post.post_type),
+                    type_label=post.post_type.replace('_', ' ').title(),
+                    media_icon=self._get_media_icon(post.media_type),
+                    media_label=post.media_type.upper()
+                ))
+        
+        parts.append(_HTML_FOOTER_TEMPLATE.format(
+            post_count=post_count, profiles_count=profiles_count, total_engagement=total_engagement,
+            sync_time=sent_at or datetime.now().strftime(f'{DATE_FORMAT} UTC')
+        ))
+        
+        return "".join(parts)
     
     def _get_type_icon(self, post_type: str) -> str:
         """Icônes par type de post"""
-        icons = {
-            'emploi': '💼', 'evenement': '📅', 'produit': '🚀', 
-            'article': '📰', 'media': '🎥', 'poll': '📊',
-            'actualite': '🔔', 'publication': '📝'
-        }
-        return icons.get(post_type, '📝')
+        return POST_TYPE_ICONS.get(post_type, '📝')
     
     def _get_media_icon(self, media_type: str) -> str:
         """Icônes par type de média"""
-        icons = {
-            'video': '🎥', 'image': '🖼️', 'text': '📝', 
-            'document': '📄', 'poll': '📊'
-        }
-        return icons.get(media_type, '📝')
+        return MEDIA_TYPE_ICONS.get(media_type, '📝')
 
 
 class LinkedInAPIMonitor:
     """Monitor révolutionnaire utilisant l'API LinkedIn officielle"""
     
-    def __init__(self, csv_file: str, email_config: Dict[str, str], api_config: Dict[str, str]):
+    def __init__(self, csv_file: str, email_config: Dict[str, str], api_config: Dict[str, str],
+                 json_report: bool = False, report_stream: Optional[TextIO] = None):
         self.csv_file = csv_file
+        self.json_report = json_report  # Rapport final en une ligne JSON (--json-report)
+        self.report_stream = report_stream  # Flux de la ligne JSON (stdout courant par défaut)
+        self.report_written = False  # Ligne JSON déjà émise pour ce cycle
         self.notifier = APIBasedEmailNotifier(
             email_config['sender_email'],
             email_config['sender_password'],
@@ -1448,16 +1950,21 @@ class LinkedInAPIMonitor:
             api_config.get('access_token', '')
         )
         
-        # Collecteur de posts
-        self.all_new_posts: List[LinkedInPost] = []
+        # Collecteur de posts par profil (URLs déjà collectées: un post n'est notifié qu'une fois par cycle)
+        self._posts_by_profile: Dict[str, List[LinkedInPost]] = defaultdict(list)
+        self._seen_post_urls: set = set()
         
         # Statistiques API
-        self.stats = {
-            'total_profiles': 0, 'api_success': 0, 'api_errors': 0,
-            'new_posts_found': 0, 'total_engagement': 0,
-            'companies_processed': 0, 'profiles_processed': 0,
-            'quota_remaining': 1000  # Quota API estimé
-        }
+        self.stats = APIStats()
+        
+        # Arrêt propre demandé par signal: profils restants ignorés, progression sauvegardée
+        # (événement partagé avec le client: les attentes de débit s'interrompent aussitôt)
+        self._stop = self.linkedin_api.stop_event
+    
+    @property
+    def all_new_posts(self) -> List[LinkedInPost]:
+        """Nouveaux posts du cycle, aplatis profil par profil (ordre du CSV)"""
+        return list(chain.from_iterable(self._posts_by_profile.values()))
     
     def load_profiles(self) -> List[ProfileData]:
         """Chargement des profils avec support ID"""
@@ -1467,41 +1974,53 @@ class LinkedInAPIMonitor:
                 return self._create_api_default_profiles()
             
             profiles = []
-            
-            with open(self.csv_file, 'r', encoding='utf-8-sig', newline='') as file:
-                reader = csv.DictReader(file)
-                for i, row in enumerate(reader, 1):
-                    profile = self._parse_api_row(row, i)
-                    if profile:
-                        profiles.append(profile)
+            skipped_lines = []  # Lignes invalides, résumées en une seule fois
+            
+            # Une seule lecture disque, quel que soit l'encodage du fichier
+            header, rows = read_csv_rows(self.csv_file)
+            
+            # Position de chaque colonne connue, calculée une seule fois
+            header = [column.strip() for column in header]
+            indexes = [header.index(column) if column in header else -1 for column in CSV_FIELDNAMES]
+            
+            for i, row in enumerate(rows, 1):
+                if not row:
+                    continue
+                profile = self._parse_api_row(row, indexes)
+                if profile:
+                    profile.mark_saved()
+                    profiles.append(profile)
+                else:
+                    skipped_lines.append(i)
             
             print(f"✅ {len(profiles)} profils API chargés")
+            if skipped_lines:
+                shown = ', '.join(map(str, skipped_lines[:10]))
+                more = '...' if len(skipped_lines) > 10 else ''
+                print(f"⚠️ {len(skipped_lines)} ligne(s) CSV ignorée(s) (URL/nom manquant ou invalide): {shown}{more}")
             return profiles
             
         except Exception as e:
+            # Fichier existant mais illisible: ne jamais l'écraser avec les profils par défaut
             print(f"❌ Erreur chargement API: {e}")
-            return self._create_api_default_profiles()
+            return []
     
-    def _parse_api_row(self, row: Dict[str, Any], line_num: int) -> Optional[ProfileData]:
-        """Parse ligne CSV avec support Profile_ID"""
+    def _parse_api_row(self, row: Sequence[str], indexes: List[int]) -> Optional[ProfileData]:
+        """Parse ligne CSV par position (index des colonnes de CSV_FIELDNAMES), None si invalide"""
         try:
-            url = str(row.get('URL', '')).strip()
-            name = str(row.get('Name', '')).strip()
-            profile_id = str(row.get('Profile_ID', '')).strip()
-            last_id = str(row.get('Last_Post_ID', '')).strip()
-            error_count = int(row.get('Error_Count', 0) or 0)
-            
-            if url and name:
-                profile = ProfileData(url, name, profile_id, last_id, error_count)
-                
-                # Auto-extraction ID si manquant
-                if not profile.profile_id:
-                    profile.profile_id = profile.extract_id_from_url()
-                
-                return profile
+            width = len(row)
+            (url, name, profile_id, last_id, error_count, etag, last_modified, validator_endpoint,
+             content_hash, last_change) = [
+                row[index] if 0 <= index < width else '' for index in indexes
+            ]
             
-        except Exception as e:
-            print(f"❌ Erreur ligne API {line_num}: {e}")
+            if url.strip() and name.strip():
+                # ID et URN auto-extraits de l'URL si manquants
+                return ProfileData(url, name, profile_id, last_id, int(error_count or 0), etag, last_modified,
+                                   content_hash, last_change, validator_endpoint)
+            
+        except ValueError:
+            pass  # Error_Count non numérique: ligne comptée comme ignorée
         
         return None
     
@@ -1515,85 +2034,173 @@ class LinkedInAPIMonitor:
         self.save_profiles(defaults)
         return defaults
     
-    def check_profile_via_api(self, profile: ProfileData) -> Optional[List[LinkedInPost]]:
-        """Vérification via API LinkedIn officielle"""
-        try:
-            print(f"🔥 API Check: {profile.name} ({profile.profile_type})")
+    def _check_stop(self, profile: ProfileData):
+        """Abandon du profil si un arrêt a été demandé"""
+        if self._stop.is_set():
+            raise FetchCancelled(profile.name)
+    
+    def _fetch_profile_posts(self, profile: ProfileData) -> Optional[List[LinkedInPost]]:
+        """Appels API d'un profil, sans toucher aux statistiques (exécutable en thread)"""
+        self._check_stop(profile)
+        
+        print(f"🔥 API Check: {profile.name} ({profile.profile_type})")
+        
+        posts = []
+        
+        if profile.profile_type == 'company':
+            # Posts d'entreprise via API
+            posts = self.linkedin_api.get_company_posts(profile.profile_id, count=5, profile=profile)
             
-            posts = []
+            # Fallback UGC si échec
+            if posts is not None and not posts:
+                self._check_stop(profile)
+                posts = self.linkedin_api.get_ugc_posts(profile.urn, count=5, profile=profile)
             
-            if profile.profile_type == 'company':
-                # Posts d'entreprise via API
-                posts = self.linkedin_api.get_company_posts(profile.profile_id, count=5)
-                
-                # Fallback UGC si échec
-                if not posts:
-                    company_urn = f"urn:li:organization:{profile.profile_id}"
-                    posts = self.linkedin_api.get_ugc_posts(company_urn, count=5)
-                
-                self.stats['companies_processed'] += 1
-                
-            elif profile.profile_type == 'person':
-                # Posts personnels (nécessite permissions étendues)
-                posts = self.linkedin_api.get_profile_posts(profile.profile_id, count=5)
-                
-                # Fallback UGC
-                if not posts:
-                    person_urn = f"urn:li:person:{profile.profile_id}"
-                    posts = self.linkedin_api.get_ugc_posts(person_urn, count=5)
-                
-                self.stats['profiles_processed'] += 1
+        elif profile.profile_type == 'person':
+            # Posts personnels (nécessite permissions étendues)
+            posts = self.linkedin_api.get_profile_posts(profile.profile_id, count=5, profile=profile)
             
-            if posts:
-                print(f"✅ {len(posts)} posts API extraits")
-                
-                # Mise à jour engagement total
-                for post in posts:
-                    self.stats['total_engagement'] += post.engagement_count
-                
-                # Mise à jour profil avec le dernier post
-                if posts:
-                    latest_post = posts[0]  # Le plus récent
-                    profile.last_post_id = latest_post.post_id
-                    profile.error_count = 0
-                    profile.last_success = datetime.now().isoformat()
-                
-                self.stats['api_success'] += 1
-                return posts
-            else:
-                print("⚠️ Aucun post trouvé via API")
-                profile.error_count += 1
-                self.stats['api_errors'] += 1
-                return None
-                
-        except Exception as e:
-            print(f"❌ Erreur API {profile.name}: {e}")
+            # Fallback UGC
+            if posts is not None and not posts:
+                self._check_stop(profile)
+                posts = self.linkedin_api.get_ugc_posts(profile.urn, count=5, profile=profile)
+        
+        return posts
+    
+    def _record_api_result(self, profile: ProfileData,
+                           posts: Optional[List[LinkedInPost]]) -> Optional[List[LinkedInPost]]:
+        """Mise à jour du profil et des statistiques après les appels API"""
+        if profile.profile_type == 'company':
+            self.stats.companies_processed += 1
+        elif profile.profile_type == 'person':
+            self.stats.profiles_processed += 1
+        
+        if posts is None:
+            # HTTP 304: rien à analyser, le dernier post connu reste valide
+            print("♻️ Aucun changement depuis le dernier cycle")
+            profile.error_count = 0
+            profile.last_success = datetime.now()
+            self.stats.api_success += 1
+            return []
+        
+        if posts:
+            print(f"✅ {len(posts)} posts API extraits")
+            
+            # Mise à jour engagement total
+            for post in posts:
+                self.stats.total_engagement += post.engagement_count
+            
+            # Mise à jour profil (last_post_id est mis à jour par _detect_new_posts)
+            profile.error_count = 0
+            profile.last_success = datetime.now()
+            
+            self.stats.api_success += 1
+            return posts
+        else:
+            print("⚠️ Aucun post trouvé via API")
             profile.error_count += 1
-            self.stats['api_errors'] += 1
+            self.stats.api_errors += 1
             return None
     
+    def _record_api_error(self, profile: ProfileData, error: BaseException) -> None:
+        """Comptabilisation d'un échec API"""
+        print(f"❌ Erreur API {profile.name}: {error}")
+        profile.error_count += 1
+        self.stats.api_errors += 1
+        return None
+    
+    def _fetch_all_profiles_threaded(self, profiles: List[ProfileData]) -> List[Any]:
+        """Appels API concurrents via ThreadPoolExecutor, résultats dans l'ordre des profils"""
+        results: List[Any] = [None] * len(profiles)
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = {pool.submit(self._fetch_profile_posts, profile): i for i, profile in enumerate(profiles)}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    results[futures[future]] = e
+        
+        return results
+    
+    def _fetch_in_priority_order(self, profiles: List[ProfileData]) -> List[Any]:
+        """Profils récemment actifs (puis les moins en erreur) interrogés en premier; résultats dans l'ordre du CSV"""
+        order = sorted(range(len(profiles)), key=lambda k: profiles[k].error_count)
+        order.sort(key=lambda k: profiles[k].last_change, reverse=True)  # Tri stable: ISO 8601 récent d'abord
+        prioritized = [profiles[k] for k in order]
+        
+        fetched = self._fetch_all_profiles_threaded(prioritized)
+        
+        results: List[Any] = [None] * len(profiles)
+        for k, result in zip(order, fetched):
+            results[k] = result
+        return results
+    
     def save_profiles(self, profiles: List[ProfileData]) -> bool:
         """Sauvegarde avec support Profile_ID"""
+        tmp_path = f"{self.csv_file}.tmp"
         try:
-            fieldnames = ['URL', 'Name', 'Profile_ID', 'Last_Post_ID', 'Error_Count']
-            
-            with open(self.csv_file, 'w', encoding='utf-8-sig', newline='') as file:
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                for profile in profiles:
-                    writer.writerow(profile.to_dict())
+            # CSV assemblé en mémoire puis écrit en un seul appel
+            buffer = io.StringIO(newline='')
+            writer = csv.writer(buffer)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(profile.to_row() for profile in profiles)
+            
+            # Écriture atomique: fichier temporaire complet puis remplacement
+            with open(tmp_path, 'w', encoding='utf-8-sig', newline='') as file:
+                file.write(buffer.getvalue())
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.csv_file)
+            self._fsync_dir(self.csv_file)
+            
+            for profile in profiles:
+                profile.mark_saved()
             
             print("💾 Profils API sauvegardés")
             return True
             
         except Exception as e:
             print(f"❌ Erreur sauvegarde API: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return False
     
+    @staticmethod
+    def _fsync_dir(path: str):
+        """Rend le renommage durable (POSIX); sans effet là où un dossier ne peut être ouvert"""
+        try:
+            fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
+    def _install_stop_handlers(self) -> Dict[int, Any]:
+        """SIGINT/SIGTERM déclenchent un arrêt propre; renvoie les gestionnaires précédents"""
+        if threading.current_thread() is not threading.main_thread():
+            return {}  # signal.signal n'est autorisé que dans le thread principal
+        return {signum: signal.signal(signum, self._request_stop) for signum in (signal.SIGINT, signal.SIGTERM)}
+    
+    def _request_stop(self, signum, frame):
+        """Premier signal: fin du cycle sur les profils déjà interrogés; second signal: arrêt immédiat"""
+        print(f"\n⏹️ Arrêt demandé ({signal.Signals(signum).name}) - sauvegarde partielle en fin de cycle")
+        self._stop.set()
+        signal.signal(signum, signal.default_int_handler if signum == signal.SIGINT else signal.SIG_DFL)
+    
     def run_api_monitoring(self) -> bool:
         """Monitoring complet via API LinkedIn"""
+        self._stop.clear()
+        self.report_written = False
+        previous_handlers = self._install_stop_handlers()
+        ok = False
+        error = ""  # Motif d'échec reporté dans la ligne JSON
         try:
-            print("=" * 100)
+            print(RULE)
             print(f"🚀 LINKEDIN API MONITOR v4.0 - {datetime.now()}")
             print("🔥 SYSTÈME RÉVOLUTIONNAIRE API OFFICIELLE:")
             print("   • 🔐 Authentification OAuth 2.0 sécurisée")
@@ -1602,45 +2209,67 @@ class LinkedInAPIMonitor:
             print("   • 💬 Données d'engagement temps réel")
             print("   • 🎨 Email ultra-premium avec contenu véritable")
             print("   • ⚡ Gestion intelligente des quotas API")
-            print("=" * 100)
+            print(RULE)
             
             # Authentification API
             if not self.linkedin_api.access_token:
                 if not self.linkedin_api.authenticate_client_credentials():
                     print("💥 ÉCHEC AUTHENTIFICATION - Arrêt du monitoring")
+                    error = "authentification échouée"
                     return False
             
             # Chargement profils
             profiles = self.load_profiles()
             if not profiles:
+                error = "aucun profil chargé"
                 return False
             
-            self.stats['total_profiles'] = len(profiles)
-            self.all_new_posts = []
-            changes_made = False
-            
-            # Traitement via API
-            for i, profile in enumerate(profiles):
+            self.stats.total_profiles = len(profiles)
+            # Horodatage de détection commun à tous les posts du cycle
+            self.linkedin_api.detection_time = datetime.now().strftime(DATE_FORMAT)
+            self._posts_by_profile = defaultdict(list)
+            self._seen_post_urls = set()
+            
+            # Profils actifs (seuil d'erreurs réduit pour API)
+            active_profiles = []
+            for profile in profiles:
+                if profile.error_count >= 3:
+                    print(f"⏭️ Profil API suspendu: {profile.name} (erreurs: {profile.error_count})")
+                else:
+                    active_profiles.append(profile)
+            
+            # Appels API en parallèle (débit limité par hôte dans le client)
+            results = self._fetch_in_priority_order(active_profiles)
+            quota_reported = self.linkedin_api.rate_limit_remaining
+            if quota_reported is not None:
+                self.stats.quota_remaining = quota_reported  # Quota réel annoncé par l'API
+            
+            # Traitement des résultats dans l'ordre du CSV
+            for i, (profile, result) in enumerate(zip(active_profiles, results)):
+                if isinstance(result, FetchCancelled):
+                    print(f"⏹️ {profile.name}: abandonné (arrêt demandé)")
+                    continue
+                
                 try:
-                    print(f"\n--- 🚀 {i+1}/{len(profiles)}: {profile.name} ({profile.profile_type}) ---")
-                    
-                    if profile.error_count >= 3:  # Seuil réduit pour API
-                        print(f"⏭️ Profil API suspendu (erreurs: {profile.error_count})")
-                        continue
+                    print(f"\n--- 🚀 {i+1}/{len(active_profiles)}: {profile.name} ({profile.profile_type}) ---")
                     
-                    # Vérification API
-                    api_posts = self.check_profile_via_api(profile)
+                    if isinstance(result, Exception):
+                        api_posts = self._record_api_error(profile, result)
+                    else:
+                        api_posts = self._record_api_result(profile, result)
+                    if quota_reported is None:
+                        self.stats.quota_remaining -= 2  # Mise à jour quota estimé
                     
                     if api_posts:
-                        # Détection nouveaux posts
-                        new_posts = self._detect_new_posts(api_posts, profile)
+                        # Détection nouveaux posts (hors doublons déjà collectés ce cycle)
+                        new_posts = self._unseen_posts(self._detect_new_posts(api_posts, profile))
                         
                         if new_posts:
-                            print(f"🆕 {len(new_posts)} NOUVEAU{'X' if len(new_posts) > 1 else ''} POST{'S' if len(new_posts) > 1 else ''} API!")
+                            new_count = len(new_posts)
+                            print(f"🆕 {new_count} NOUVEAU{plural(new_count, 'X')} POST{plural(new_count, 'S')} API!")
                             
-                            self.all_new_posts.extend(new_posts)
-                            self.stats['new_posts_found'] += len(new_posts)
-                            changes_made = True
+                            self._posts_by_profile[profile.name].extend(new_posts)
+                            self.stats.new_posts_found += new_count
                             
                             # Affichage détaillé
                             for j, post in enumerate(new_posts):
@@ -1651,41 +2280,45 @@ class LinkedInAPIMonitor:
                                 print(f"      🎬 Type: {post.media_type} | 🏷️ Catégorie: {post.post_type}")
                         else:
                             print("⚪ Aucun nouveau post détecté")
-                    
-                    # Pause respectueuse des quotas API
-                    if i < len(profiles) - 1:
-                        api_pause = random.randint(15, 25)  # Pause API optimisée
-                        print(f"⏳ Pause API respectueuse: {api_pause}s...")
-                        time.sleep(api_pause)
-                        
-                        # Mise à jour quota estimé
-                        self.stats['quota_remaining'] -= 2
                 
                 except Exception as e:
                     print(f"❌ Erreur API {profile.name}: {e}")
                     profile.error_count += 1
-                    self.stats['api_errors'] += 1
+                    self.stats.api_errors += 1
             
-            # Sauvegarde si changements
-            if changes_made:
+            # Sauvegarde (uniquement si un profil a changé)
+            if any(profile.is_dirty for profile in profiles):
                 self.save_profiles(profiles)
+            else:
+                print("💾 Aucun changement de profil - CSV inchangé")
             
             # Notification ultra-premium
-            if self.all_new_posts:
+            if self._posts_by_profile:
                 print(f"\n🎨 Envoi notification API premium...")
                 if self.notifier.send_api_optimized_notification(self.all_new_posts):
                     print("🎉 Notification API premium envoyée!")
                 else:
                     print("❌ Échec notification API")
             
-            # Rapport détaillé
-            self._print_api_monitoring_report()
+            # Rapport détaillé (la ligne JSON est écrite dans le finally, sur tous les chemins)
+            if not self.json_report:
+                self._print_api_monitoring_report()
             
-            return self.stats['api_success'] > 0 or self.stats['new_posts_found'] > 0
+            ok = self.stats.api_success > 0 or self.stats.new_posts_found > 0
+            return ok
             
         except Exception as e:
-            print(f"💥 ERREUR SYSTÈME API: {e}")
+            logger.exception("💥 ERREUR SYSTÈME API: %s", e)
+            error = str(e) or type(e).__name__
             return False
+        
+        finally:
+            if self.json_report:
+                self._write_json_report(ok, error)
+            self.notifier.close()
+            self.linkedin_api.close()
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
     
     def _detect_new_posts(self, api_posts: List[LinkedInPost], profile: ProfileData) -> List[LinkedInPost]:
         """Détection des nouveaux posts via comparaison ID"""
@@ -1698,6 +2331,7 @@ class LinkedInAPIMonitor:
         if not profile.last_post_id:
             latest = api_posts[0]
             profile.last_post_id = latest.post_id
+            profile.last_change = datetime.now().isoformat(timespec='seconds')
             return [latest]
         
         # Comparaison avec historique
@@ -1707,86 +2341,126 @@ class LinkedInAPIMonitor:
             else:
                 break  # On s'arrête au dernier post connu
         
+        # Le plus récent devient la référence du prochain cycle
+        profile.last_post_id = api_posts[0].post_id
+        if new_posts:
+            profile.last_change = datetime.now().isoformat(timespec='seconds')
         return new_posts
     
+    def _unseen_posts(self, posts: List[LinkedInPost]) -> List[LinkedInPost]:
+        """Posts pas encore collectés ce cycle (même post remonté par deux profils du CSV)"""
+        unseen = []
+        for post in posts:
+            if post.post_url not in self._seen_post_urls:
+                self._seen_post_urls.add(post.post_url)
+                unseen.append(post)
+        return unseen
+    
+    def _write_json_report(self, ok: bool, error: str = ""):
+        """Ligne JSON du cycle: statut, motif d'échec et statistiques collectées jusque-là"""
+        report = {'ok': ok, 'error': error or None}
+        report.update(self.stats.as_dict())
+        report['by_profile'] = {name: len(posts) for name, posts in self._posts_by_profile.items()}
+        write_json_line(self.report_stream or sys.stdout, report)
+        self.report_written = True
+    
     def _print_api_monitoring_report(self):
         """Rapport de monitoring API détaillé"""
-        print("\n" + "🚀" + "=" * 98 + "🚀")
-        print("📊 RAPPORT MONITORING API LINKEDIN OFFICIELLE")
-        print("🚀" + "=" * 98 + "🚀")
-        
-        print(f"📋 Profils traités: {self.stats['api_success']}/{self.stats['total_profiles']}")
-        print(f"🏢 Entreprises: {self.stats['companies_processed']}")
-        print(f"👤 Profils personnels: {self.stats['profiles_processed']}")
-        print(f"🆕 Nouveaux posts: {self.stats['new_posts_found']}")
-        print(f"💬 Engagement total: {self.stats['total_engagement']}")
-        print(f"❌ Erreurs API: {self.stats['api_errors']}")
-        print(f"📊 Quota restant: ~{self.stats['quota_remaining']}")
+        # Lignes accumulées puis écrites en un seul appel
+        lines = [
+            "\n" + BANNER,
+            "📊 RAPPORT MONITORING API LINKEDIN OFFICIELLE",
+            BANNER,
+            f"📋 Profils traités: {self.stats.api_success}/{self.stats.total_profiles}",
+            f"🏢 Entreprises: {self.stats.companies_processed}",
+            f"👤 Profils personnels: {self.stats.profiles_processed}",
+            f"🆕 Nouveaux posts: {self.stats.new_posts_found}",
+            f"💬 Engagement total: {self.stats.total_engagement}",
+            f"❌ Erreurs API: {self.stats.api_errors}",
+            f"📊 Quota restant: ~{self.stats.quota_remaining}",
+        ]
         
         # Détail des posts
-        if self.all_new_posts:
-            print(f"\n🎉 POSTS AUTHENTIQUES DÉTECTÉS VIA API:")
+        if self._posts_by_profile:
+            lines.append(f"\n🎉 POSTS AUTHENTIQUES DÉTECTÉS VIA API:")
             for i, post in enumerate(self.all_new_posts, 1):
-                print(f"   {i}. 🎯 {post.profile_name}")
-                print(f"      📰 {post.post_title}")
-                print(f"      ✏️ {post.post_description[:70]}...")
-                print(f"      👤 Auteur: {post.author_name}")
-                print(f"      🎬 Média: {post.media_type} | 💬 Engagement: {post.engagement_count}")
-                print(f"      📅 Publié: {post.published_date}")
-                print(f"      ─" * 80)
+                lines.append(f"   {i}. 🎯 {post.profile_name}")
+                lines.append(f"      📰 {post.post_title}")
+                lines.append(f"      ✏️ {post.post_description[:70]}...")
+                lines.append(f"      👤 Auteur: {post.author_name}")
+                lines.append(f"      🎬 Média: {post.media_type} | 💬 Engagement: {post.engagement_count}")
+                lines.append(f"      📅 Publié: {post.published_date}")
+                lines.append(f"      ─" * 80)
         
         # Recommandations
-        success_rate = (self.stats['api_success'] / self.stats['total_profiles'] * 100) if self.stats['total_profiles'] > 0 else 0
-        print(f"\n📈 Taux de réussite API: {success_rate:.1f}%")
+        success_rate = (self.stats.api_success / self.stats.total_profiles * 100) if self.stats.total_profiles > 0 else 0
+        lines.append(f"\n📈 Taux de réussite API: {success_rate:.1f}%")
         
-        if self.stats['quota_remaining'] < 100:
-            print("⚠️ ATTENTION: Quota API faible - Considérez l'upgrade")
+        if self.stats.quota_remaining < 100:
+            lines.append("⚠️ ATTENTION: Quota API faible - Considérez l'upgrade")
         
-        print("🚀" + "=" * 98 + "🚀")
+        lines.append(BANNER)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+# Variables d'environnement attendues -> clés de configuration
+EMAIL_ENV_VARS = {
+    'GMAIL_EMAIL': 'sender_email',
+    'GMAIL_APP_PASSWORD': 'sender_password',
+    'RECIPIENT_EMAIL': 'recipient_email'
+}
+API_ENV_VARS = {
+    'LINKEDIN_CLIENT_ID': 'client_id',
+    'LINKEDIN_CLIENT_SECRET': 'client_secret',
+    'LINKEDIN_ACCESS_TOKEN': 'access_token'  # Optionnel pour client_credentials
+}
+
+
+@lru_cache(maxsize=32)
+def _mask(value: str, head: int = 3, tail: int = 3) -> str:
+    """Valeur masquée pour l'affichage (début et fin visibles si assez longue)"""
+    if len(value) <= head + tail:
+        return "***"
+    return value[:head] + "*" * (len(value) - head - tail) + value[-tail:]
 
 
 def validate_api_environment() -> tuple[Dict[str, str], Dict[str, str]]:
-    """Validation environnement avec support API"""
+    """Validation environnement avec support API (refaite seulement si les variables changent)"""
+    values = tuple(os.getenv(env_var, '').strip() for env_var in (*EMAIL_ENV_VARS, *API_ENV_VARS))
+    email_config, api_config = _validate_env_values(values)
+    # Copies: le résultat mémoïsé ne doit pas être modifié par l'appelant
+    return dict(email_config), dict(api_config)
+
+
+@lru_cache(maxsize=1)
+def _validate_env_values(values: Tuple[str, ...]) -> tuple[Dict[str, str], Dict[str, str]]:
+    """Validation et affichage masqué d'un instantané des variables d'environnement"""
     print("🔧 Validation environnement API LinkedIn...")
     
-    # Configuration email
-    email_vars = {
-        'GMAIL_EMAIL': 'sender_email',
-        'GMAIL_APP_PASSWORD': 'sender_password',
-        'RECIPIENT_EMAIL': 'recipient_email'
-    }
-    
-    # Configuration API LinkedIn
-    api_vars = {
-        'LINKEDIN_CLIENT_ID': 'client_id',
-        'LINKEDIN_CLIENT_SECRET': 'client_secret',
-        'LINKEDIN_ACCESS_TOKEN': 'access_token'  # Optionnel pour client_credentials
-    }
-    
+    env = dict(zip((*EMAIL_ENV_VARS, *API_ENV_VARS), values))
     email_config = {}
     api_config = {}
     missing = []
     
     # Validation email
-    for env_var, config_key in email_vars.items():
-        value = os.getenv(env_var, '').strip()
+    for env_var, config_key in EMAIL_ENV_VARS.items():
+        value = env[env_var]
         if value:
             email_config[config_key] = value
-            display_value = value[:3] + "*" * (len(value)-6) + value[-3:] if len(value) > 6 else "***"
-            print(f"✅ {env_var}: {display_value}")
+            print(f"✅ {env_var}: {_mask(value)}")
         else:
             missing.append(env_var)
     
     # Validation API
-    for env_var, config_key in api_vars.items():
-        value = os.getenv(env_var, '').strip()
+    for env_var, config_key in API_ENV_VARS.items():
+        value = env[env_var]
         if value:
             api_config[config_key] = value
             if config_key == 'access_token':
                 print(f"✅ {env_var}: Token fourni")
             else:
-                display_value = value[:6] + "*" * (len(value)-10) + value[-4:] if len(value) > 10 else "***"
-                print(f"✅ {env_var}: {display_value}")
+                print(f"✅ {env_var}: {_mask(value, 6, 4)}")
         elif env_var != 'LINKEDIN_ACCESS_TOKEN':  # Token optionnel
             missing.append(env_var)
     
@@ -1828,53 +2502,74 @@ qui ne nécessitent que client_credentials flow.
 """)
 
 
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Options de ligne de commande"""
+    parser = argparse.ArgumentParser(description="LinkedIn Monitor v4.0 - API officielle")
+    parser.add_argument('--json-report', action='store_true',
+                        help="rapport final sur une ligne JSON (statistiques + posts par profil); "
+                             "seule cette ligne est écrite sur stdout, le reste part sur stderr")
+    return parser.parse_args(argv)
+
+
 def main():
     """Point d'entrée révolutionnaire API"""
-    try:
-        print("🚀" + "=" * 98 + "🚀")
-        print("🔥 LINKEDIN MONITOR v4.0 - API OFFICIELLE RÉVOLUTIONNAIRE")
-        print("🎯 EXTRACTION AUTHENTIQUE LINKEDIN:")
-        print("   • 🔐 Authentification OAuth 2.0 sécurisée")
-        print("   • 📡 API LinkedIn v2 + UGC Posts endpoints")
-        print("   • 🎯 Vrais titres et descriptions des posts")
-        print("   • 💬 Données d'engagement temps réel")
-        print("   • 🎨 Email ultra-premium avec contenu authentique")
-        print("   • ⚡ Gestion intelligente des quotas et permissions")
-        print("   • 🛡️ Support Company Pages + Personal Profiles")
-        print("🚀" + "=" * 98 + "🚀")
-        
-        # Validation
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    
+    # Avec --json-report, stdout ne porte que la ligne JSON: affichage (threads compris) sur stderr
+    report_stream = sys.stdout if args.json_report else None
+    monitor = None
+    with contextlib.redirect_stdout(sys.stderr) if report_stream else contextlib.nullcontext():
         try:
-            email_config, api_config = validate_api_environment()
-        except ValueError as e:
-            print(f"❌ {e}")
-            print("\n" + "="*50)
-            setup_linkedin_app_guide()
-            sys.exit(1)
-        
-        # Lancement API monitoring
-        monitor = LinkedInAPIMonitor("linkedin_urls.csv", email_config, api_config)
-        success = monitor.run_api_monitoring()
-        
-        # Résultat final
-        if success:
-            print("🎉 MONITORING API LINKEDIN RÉUSSI!")
-            if monitor.all_new_posts:
-                engagement_total = sum(p.engagement_count for p in monitor.all_new_posts)
-                print(f"🎯 {len(monitor.all_new_posts)} posts authentiques extraits")
-                print(f"💬 {engagement_total} interactions totales")
-                print("🎨 Email premium avec contenu véritable envoyé!")
+            print(BANNER)
+            print("🔥 LINKEDIN MONITOR v4.0 - API OFFICIELLE RÉVOLUTIONNAIRE")
+            print("🎯 EXTRACTION AUTHENTIQUE LINKEDIN:")
+            print("   • 🔐 Authentification OAuth 2.0 sécurisée")
+            print("   • 📡 API LinkedIn v2 + UGC Posts endpoints")
+            print("   • 🎯 Vrais titres et descriptions des posts")
+            print("   • 💬 Données d'engagement temps réel")
+            print("   • 🎨 Email ultra-premium avec contenu authentique")
+            print("   • ⚡ Gestion intelligente des quotas et permissions")
+            print("   • 🛡️ Support Company Pages + Personal Profiles")
+            print(BANNER)
+            
+            # Validation
+            try:
+                email_config, api_config = validate_api_environment()
+            except ValueError as e:
+                print(f"❌ {e}")
+                print("\n" + SHORT_RULE)
+                setup_linkedin_app_guide()
+                if report_stream:
+                    write_json_line(report_stream, {'ok': False, 'error': str(e)})
+                sys.exit(1)
+            
+            # Lancement API monitoring
+            monitor = LinkedInAPIMonitor("linkedin_urls.csv", email_config, api_config,
+                                         json_report=args.json_report, report_stream=report_stream)
+            success = monitor.run_api_monitoring()
+            
+            # Résultat final
+            if success:
+                print("🎉 MONITORING API LINKEDIN RÉUSSI!")
+                new_posts = monitor.all_new_posts
+                if new_posts:
+                    engagement_total = sum(p.engagement_count for p in new_posts)
+                    print(f"🎯 {len(new_posts)} posts authentiques extraits")
+                    print(f"💬 {engagement_total} interactions totales")
+                    print("🎨 Email premium avec contenu véritable envoyé!")
+                else:
+                    print("✅ Système API actif - Monitoring en cours")
+                sys.exit(0)
             else:
-                print("✅ Système API actif - Monitoring en cours")
-            sys.exit(0)
-        else:
-            print("⚠️ Monitoring API en attente - Vérifiez la configuration")
+                print("⚠️ Monitoring API en attente - Vérifiez la configuration")
+                sys.exit(0)
+        
+        except Exception as e:
+            logger.exception("💥 ERREUR SYSTÈME API: %s", e)
+            if report_stream and not (monitor and monitor.report_written):
+                write_json_line(report_stream, {'ok': False, 'error': str(e) or type(e).__name__})
             sys.exit(0)
-    
-    except Exception as e:
-        print(f"💥 ERREUR SYSTÈME API: {e}")
-        traceback.print_exc()
-        sys.exit(0)
 
 
 if __name__ == "__main__":
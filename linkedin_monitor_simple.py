@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
-import requests, csv, json, smtplib, os
+import requests, csv, json, smtplib, os, re
 from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+COMPANY_ID_RE = re.compile(r'/company/([^/]+)')
+
 def authenticate():
     print("🔐 Authentification LinkedIn...")
     auth_data = {
@@ -161,8 +163,7 @@ def load_or_create_csv():
                 profile_id = row.get('Profile_ID', '').strip()
                 
                 if not profile_id and '/company/' in url:
-                    import re
-                    match = re.search(r'/company/([^/]+)', url)
+                    match = COMPANY_ID_RE.search(url)
                     if match:
                         profile_id = match.group(1)
                 
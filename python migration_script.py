@@ -7,25 +7,20 @@ import csv
 import re
 import os
 import shutil
+from collections import Counter
 from datetime import datetime
 from typing import List, Dict
 
+# Expressions compilées une seule fois à l'import
+_PROFILE_ID_RE = re.compile(r'/(?:company|in)/([^/]+)')
 
 def extract_profile_id_from_url(url: str) -> str:
     """Extraction automatique de l'ID depuis l'URL LinkedIn"""
     url = url.strip().rstrip('/')
     
-    # Company ID
-    company_match = re.search(r'/company/([^/]+)', url)
-    if company_match:
-        return company_match.group(1)
-    
-    # Personal profile ID
-    profile_match = re.search(r'/in/([^/]+)', url)
-    if profile_match:
-        return profile_match.group(1)
-    
-    return ""
+    # Company ID ou personal profile ID en une seule recherche
+    match = _PROFILE_ID_RE.search(url)
+    return match.group(1) if match else ""
 
 
 def detect_profile_type(url: str) -> str:
@@ -73,30 +68,22 @@ def migrate_csv_to_api_format(input_file: str, output_file: str) -> bool:
                         'Error_Count': error_count,
                         'Profile_Type': profile_type
                     })
-                    
-                    print(f"✅ Migré: {name} → ID: {profile_id} ({profile_type})")
         
         # Écriture nouveau format
         fieldnames = ['URL', 'Name', 'Profile_ID', 'Last_Post_ID', 'Error_Count']
         
         with open(output_file, 'w', encoding='utf-8-sig', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            # Profile_Type n'est utilisé que pour le rapport: ignoré à l'écriture
+            writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction='ignore')
             writer.writeheader()
-            
-            for profile in profiles:
-                writer.writerow({
-                    'URL': profile['URL'],
-                    'Name': profile['Name'],
-                    'Profile_ID': profile['Profile_ID'],
-                    'Last_Post_ID': profile['Last_Post_ID'],
-                    'Error_Count': profile['Error_Count']
-                })
+            writer.writerows(profiles)
         
         print(f"🎉 Migration réussie: {len(profiles)} profils migrés")
         
         # Rapport de migration
-        companies = len([p for p in profiles if p['Profile_Type'] == 'company'])
-        persons = len([p for p in profiles if p['Profile_Type'] == 'person'])
+        type_counts = Counter(p['Profile_Type'] for p in profiles)  # Un seul passage
+        companies = type_counts['company']
+        persons = type_counts['person']
         
         print(f"📊 Répartition:")
         print(f"   🏢 Entreprises: {companies}")